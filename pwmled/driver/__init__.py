@@ -6,6 +6,7 @@ class Driver:
     """Represents the base class for pwm drivers."""
 
     IO_TRIES = 10
+    FRAME_MAX_VALUE = 255
 
     def __init__(self, pins, resolution, freq):
         """
@@ -22,8 +23,15 @@ class Driver:
         self._resolution = resolution
         self._freq = freq
         self._state = [0] * len(self._pins)
+        self._limiter = None
         self._max_raw_value = math.pow(2, self._resolution) - 1
 
+        # Lookup tables for converting 8-bit frame levels
+        self._frame_values = [v / self.FRAME_MAX_VALUE
+                              for v in range(self.FRAME_MAX_VALUE + 1)]
+        self._frame_raw_values = [self._to_single_raw_pwm(v)
+                                  for v in self._frame_values]
+
     @property
     def pins(self):
         """
@@ -33,6 +41,34 @@ class Driver:
         """
         return self._pins
 
+    @property
+    def state(self):
+        """
+        State property.
+
+        :return: The uniform pwm values (0.0-1.0) of the controlled pins,
+                 before being scaled by the limiter.
+        """
+        return self._state
+
+    @property
+    def limiter(self):
+        """
+        Limiter property.
+
+        :return: The power limiter the driver is attached to, if any.
+        """
+        return self._limiter
+
+    @limiter.setter
+    def limiter(self, limiter):
+        """
+        Attach the driver to a power limiter.
+
+        :param limiter: The limiter or None.
+        """
+        self._limiter = limiter
+
     def set_pwm(self, values):
         """
         Set pwm values on the controlled pins.
@@ -46,14 +82,81 @@ class Driver:
         if not all(0 <= v <= 1 for v in values):
             raise ValueError('Values must be between 0 and 1.')
 
+        self._write_pwm(self._to_raw_pwm(values), values)
+
+    def set_pwm_frame(self, frame):
+        """
+        Set 8-bit pwm levels on the controlled pins.
+
+        Bulk alternative to set_pwm, e.g. for frames received from the
+        network. Levels are converted using lookup tables and do not
+        need to be validated, since a byte is always in range.
+
+        :param frame: Bytes-like object with one level (0-255) per pin.
+        """
+        if len(frame) != len(self._pins):
+            raise ValueError('Number of values has to be identical with '
+                             'the number of pins.')
+
+        self._write_pwm(
+            [self._frame_raw_values[v] for v in frame],
+            [self._frame_values[v] for v in frame],
+        )
+
+    def refresh_pwm(self):
+        """Rewrite the current state, e.g. after the power limit changed."""
+        limiter = self._limiter
+        if limiter is None:
+            self._try_set_pwm(self._to_raw_pwm(self._state))
+            return
+
+        with limiter.lock:
+            self._try_set_pwm(self._to_raw_pwm(
+                [v * limiter.factor for v in self._state]
+            ))
+
+    def _write_pwm(self, raw_values, values):
+        """
+        Write pwm values to the controlled pins regarding the power limit.
+
+        :param raw_values: Raw, driver-specific values to set.
+        :param values: The corresponding uniform values (0.0-1.0).
+        """
+        limiter = self._limiter
+        if limiter is None:
+            self._try_set_pwm(raw_values)
+            self._state = values
+            return
+
+        # Keep the load of the limiter and the state consistent, even if
+        # writing fails, and prevent other threads from changing the
+        # factor before the values are written.
+        with limiter.lock:
+            factor_changed = limiter.update(self, self._state, values)
+            self._state = values
+            try:
+                if limiter.factor < 1:
+                    raw_values = self._to_raw_pwm(
+                        [v * limiter.factor for v in values]
+                    )
+                self._try_set_pwm(raw_values)
+            finally:
+                if factor_changed:
+                    limiter.refresh_drivers(exclude=self)
+
+    def _try_set_pwm(self, raw_values):
+        """
+        Set raw pwm values on the controlled pins, retrying on IO errors.
+
+        :param raw_values: Raw, driver-specific values to set.
+        """
         for tries in range(self.IO_TRIES):
             try:
-                self._set_pwm(self._to_raw_pwm(values))
+                self._set_pwm(raw_values)
                 break
             except IOError as error:
                 if tries == self.IO_TRIES - 1:
                     raise error
-        self._state = values
 
     def _set_pwm(self, values):
         """
@@ -0,0 +1,197 @@
+"""Power budgeting for pwm drivers."""
+import logging
+import threading
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PowerLimiter:
+    """Represents a limiter of the total load of drivers on a shared supply."""
+
+    def __init__(self, budget, hysteresis=0.1):
+        """
+        Initialize the limiter.
+
+        :param budget: The maximum load of the supply, in the same unit as
+                       the loads of the channels (e.g. ampere).
+        :param hysteresis: The headroom (0.0-1.0) left below the budget
+                           when limiting, so that small changes of the load
+                           do not require rewriting all drivers.
+        """
+        if budget <= 0:
+            raise ValueError('Budget must be greater than 0.')
+        if not 0 <= hysteresis < 1:
+            raise ValueError('Hysteresis must be between 0 and 1.')
+
+        self._budget = budget
+        self._hysteresis = hysteresis
+        self._loads = {}
+        self._load = 0
+        self._factor = 1
+        self._lock = threading.RLock()
+
+    @property
+    def budget(self):
+        """
+        Budget property.
+
+        :return: The maximum load of the supply.
+        """
+        return self._budget
+
+    @property
+    def load(self):
+        """
+        Load property.
+
+        :return: The requested load of all drivers, before being limited.
+        """
+        return self._load
+
+    @property
+    def factor(self):
+        """
+        Factor property.
+
+        :return: The factor the pwm values of all drivers are scaled with
+                 (0.0-1.0).
+        """
+        return self._factor
+
+    @property
+    def lock(self):
+        """
+        Lock property.
+
+        :return: The lock that has to be held while writing attached drivers.
+        """
+        return self._lock
+
+    def add_driver(self, driver, loads=1):
+        """
+        Attach a driver to the limiter.
+
+        :param driver: The driver to limit.
+        :param loads: The load of a channel at full duty cycle. Either a
+                      single value for all channels or a list with one
+                      value per pin.
+        """
+        if not isinstance(loads, list):
+            loads = [loads] * len(driver.pins)
+        if len(loads) != len(driver.pins):
+            raise ValueError('Number of loads has to be identical with '
+                             'the number of pins.')
+        if driver.limiter is not None:
+            raise ValueError('Driver is already attached to a limiter.')
+
+        with self._lock:
+            self._loads[driver] = loads
+            self._load += self._get_load(loads, driver.state)
+            driver.limiter = self
+            if self._update_factor():
+                self.refresh_drivers(exclude=driver)
+            driver.refresh_pwm()
+
+    def remove_driver(self, driver):
+        """
+        Detach a driver from the limiter.
+
+        :param driver: The driver to detach.
+        """
+        if driver.limiter is not self:
+            raise ValueError('Driver is not attached to this limiter.')
+
+        with self._lock:
+            loads = self._loads.pop(driver)
+            self._load -= self._get_load(loads, driver.state)
+            driver.limiter = None
+            if self._update_factor():
+                self.refresh_drivers()
+            driver.refresh_pwm()
+
+    def update(self, driver, old_values, new_values):
+        """
+        Account for new pwm values of a driver.
+
+        The total load is updated incrementally from the changed channels
+        only. If the factor changed considerably (see _update_factor), the
+        other drivers have to be rewritten using refresh_drivers, once
+        the state of the driver has been updated.
+
+        :param driver: The driver whose values are changing.
+        :param old_values: The current values of the driver (0.0-1.0).
+        :param new_values: The values to set (0.0-1.0).
+        :return: True, if the factor changed. False otherwise.
+        """
+        with self._lock:
+            loads = self._loads[driver]
+            for load, old, new in zip(loads, old_values, new_values):
+                if old != new:
+                    self._load += (new - old) * load
+
+            return self._update_factor()
+
+    def refresh_drivers(self, exclude=None):
+        """
+        Rewrite the attached drivers using the current factor.
+
+        A driver failing to write does not prevent the others from being
+        rewritten. The first error is raised after all drivers were
+        processed.
+
+        :param exclude: Driver that must not be rewritten.
+        """
+        first_error = None
+        with self._lock:
+            for driver in list(self._loads):
+                if driver is exclude:
+                    continue
+                try:
+                    driver.refresh_pwm()
+                except Exception as error:
+                    _LOGGER.error('Rewriting driver failed: %s', error)
+                    if first_error is None:
+                        first_error = error
+
+        if first_error is not None:
+            raise first_error
+
+    def _update_factor(self):
+        """
+        Recalculate the factor.
+
+        The factor is lowered as soon as the budget is exceeded, leaving
+        some headroom for further increases of the load. It is only raised
+        again, once it can grow by more than the hysteresis or back to 1.
+        This way all drivers are rewritten only a few times while many
+        leds fade simultaneously, rather than on every change.
+
+        :return: True, if the factor changed. False otherwise.
+        """
+        # Clamp to compensate rounding errors of the running sum
+        self._load = max(0, self._load)
+        limit = self._budget * (1 - self._hysteresis)
+        if self._load > limit:
+            factor = limit / self._load
+        else:
+            factor = 1
+
+        exceeded = self._factor * self._load > self._budget
+        recovered = factor == 1 and self._factor < 1
+        raised = factor > self._factor * (1 + self._hysteresis)
+        if not (exceeded or recovered or raised):
+            return False
+
+        self._factor = factor
+        return True
+
+    @staticmethod
+    def _get_load(loads, values):
+        """
+        Calculate the load of a driver.
+
+        :param loads: The loads of the channels at full duty cycle.
+        :param values: The pwm values of the channels (0.0-1.0).
+        :return: The load of the driver.
+        """
+        return sum(load * value for load, value in zip(loads, values))
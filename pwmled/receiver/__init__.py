@@ -0,0 +1,235 @@
+"""Generic network frame receiver."""
+import logging
+import socket
+import threading
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _Mapping:
+    """Represents a range of channels of a universe mapped onto a driver."""
+
+    __slots__ = ('driver', 'start', 'end', 'last_frame', 'last_state')
+
+    def __init__(self, driver, start):
+        """
+        Initialize the mapping.
+
+        :param driver: The driver to control.
+        :param start: The offset of the first channel in the frame data.
+        """
+        self.driver = driver
+        self.start = start
+        self.end = start + len(driver.pins)
+        self.last_frame = None
+        self.last_state = None
+
+
+class Receiver:
+    """Represents the base class for receivers of network frame streams."""
+
+    CHANNEL_COUNT = 512
+    SEQUENCE_WINDOW = 20
+    BUFFER_SIZE = 1024
+    POLL_TIMEOUT = 0.5
+
+    def __init__(self, host, port):
+        """
+        Initialize the receiver.
+
+        :param host: The address to listen on.
+        :param port: The UDP port to listen on.
+        """
+        self._host = host
+        self._port = port
+        self._mappings = {}
+        self._sequences = {}
+        self._socket = None
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._buffer = bytearray(self.BUFFER_SIZE)
+        self._error = None
+
+    @property
+    def universes(self):
+        """
+        Universes property.
+
+        :return: The universes that are mapped onto drivers.
+        """
+        return list(self._mappings)
+
+    @property
+    def running(self):
+        """
+        Running property.
+
+        :return: True, if frames are being received. False otherwise.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def error(self):
+        """
+        Error property.
+
+        :return: The error that stopped receiving frames, if any.
+        """
+        return self._error
+
+    def add_driver(self, driver, universe, channel=1):
+        """
+        Map a range of channels of a universe onto the pins of a driver.
+
+        The driver controls as many consecutive channels as it has pins.
+        Mappings have to be added before the receiver is started.
+
+        :param driver: The driver to control.
+        :param universe: The universe to listen to.
+        :param channel: The first channel (1-512) of the range.
+        """
+        if not 1 <= channel <= self.CHANNEL_COUNT - len(driver.pins) + 1:
+            raise ValueError(f'Channels must be between 1 and '
+                             f'{self.CHANNEL_COUNT}.')
+
+        mappings = self._mappings.setdefault(universe, [])
+        mappings.append(_Mapping(driver, channel - 1))
+
+    def start(self):
+        """Start receiving frames in a separate thread."""
+        if self.running:
+            return
+
+        # Release resources of a previous run that stopped due to an error
+        self.stop()
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.settimeout(self.POLL_TIMEOUT)
+        self._socket.bind((self._get_bind_address(), self._port))
+        self._setup_socket(self._socket)
+
+        self._error = None
+        self._sequences.clear()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._receive_loop,
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop receiving frames and release resources."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def _get_bind_address(self):
+        """
+        Get the address the socket is bound to.
+
+        May be overridden by inheriting classes.
+        :return: The address to bind to.
+        """
+        return self._host
+
+    def _setup_socket(self, sock):
+        """
+        Method stub for protocol-specific configuration of the socket.
+
+        May be implemented by inheriting classes.
+        :param sock: The bound socket.
+        """
+        pass
+
+    def _receive_loop(self):
+        """Receive packets and apply the contained frames to the drivers."""
+        view = memoryview(self._buffer)
+        while not self._stop_event.is_set():
+            try:
+                size = self._socket.recv_into(self._buffer)
+                frame = self._parse(view[:size])
+                if frame is not None:
+                    universe, sequence, data = frame
+                    if self._is_in_sequence(universe, sequence):
+                        self._apply_frame(universe, data)
+            except socket.timeout:
+                continue
+            except Exception as error:
+                if not self._stop_event.is_set():
+                    _LOGGER.exception('Receiving frames failed')
+                    self._error = error
+                return
+
+    def _parse(self, packet):
+        """
+        Method stub for decoding a packet.
+
+        Has to be implemented by inheriting classes.
+        :param packet: Memoryview of the received packet.
+        :return: Tuple of universe, sequence number (None, if disabled)
+                 and memoryview of the channel data, or None, if the
+                 packet does not contain a frame.
+        """
+        raise NotImplementedError
+
+    def _is_in_sequence(self, universe, sequence):
+        """
+        Check that a packet did not arrive out of sequence.
+
+        Packets whose 8-bit sequence number is behind the last one of
+        the universe by less than SEQUENCE_WINDOW are discarded, so that
+        reordered datagrams do not apply stale frames. Larger jumps are
+        accepted, e.g. when the sender was restarted.
+
+        :param universe: The universe of the packet.
+        :param sequence: The sequence number of the packet or None.
+        :return: True, if the packet should be applied. False otherwise.
+        """
+        if sequence is None:
+            return True
+
+        last_sequence = self._sequences.get(universe)
+        if last_sequence is not None:
+            diff = (sequence - last_sequence + 128) % 256 - 128
+            if -self.SEQUENCE_WINDOW < diff <= 0:
+                return False
+
+        self._sequences[universe] = sequence
+        return True
+
+    def _apply_frame(self, universe, data):
+        """
+        Write the channel data of a frame to the mapped drivers.
+
+        Drivers whose channels did not change since the last frame are
+        skipped, unless the driver was written by others (e.g. a led)
+        in the meantime. A driver failing to write does not affect
+        the other drivers.
+
+        :param universe: The universe of the frame.
+        :param data: Memoryview of the channel data.
+        """
+        for mapping in self._mappings.get(universe, ()):
+            driver = mapping.driver
+            frame = data[mapping.start:mapping.end]
+            if len(frame) != len(driver.pins):
+                continue
+            if (frame == mapping.last_frame
+                    and driver.state is mapping.last_state):
+                continue
+
+            try:
+                driver.set_pwm_frame(frame)
+            except Exception:
+                # Drivers may raise library-specific errors as well
+                _LOGGER.exception('Writing frame to driver failed')
+                mapping.last_frame = None
+                continue
+
+            mapping.last_frame = bytes(frame)
+            mapping.last_state = driver.state
@@ -0,0 +1,42 @@
+"""Art-Net frame receiver."""
+from pwmled.receiver import Receiver
+
+
+class ArtNetReceiver(Receiver):
+    """Represents a receiver of ArtDmx packets sent via Art-Net."""
+
+    PORT = 6454
+    ID = b'Art-Net\x00'
+    OP_DMX = 0x5000
+    HEADER_SIZE = 18
+
+    def __init__(self, host='', port=PORT):
+        """
+        Initialize the receiver.
+
+        :param host: The address to listen on.
+        :param port: The UDP port to listen on.
+        """
+        super().__init__(host, port)
+
+    def _parse(self, packet):
+        """
+        Decode an ArtDmx packet.
+
+        :param packet: Memoryview of the received packet.
+        :return: Tuple of universe (15-bit port address), sequence number
+                 and memoryview of the channel data, or None, if the
+                 packet is no ArtDmx packet.
+        """
+        if len(packet) < self.HEADER_SIZE or packet[:8] != self.ID:
+            return None
+        if packet[8] | packet[9] << 8 != self.OP_DMX:
+            return None
+
+        # A sequence number of 0 disables sequencing
+        sequence = packet[12] or None
+        universe = packet[14] | (packet[15] & 0x7f) << 8
+        length = packet[16] << 8 | packet[17]
+        data = packet[self.HEADER_SIZE:self.HEADER_SIZE + length]
+
+        return universe, sequence, data
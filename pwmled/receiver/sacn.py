@@ -0,0 +1,92 @@
+"""sACN (E1.31) frame receiver."""
+import socket
+
+from pwmled.receiver import Receiver
+
+
+class SacnReceiver(Receiver):
+    """Represents a receiver of DMX data packets sent via sACN (E1.31)."""
+
+    PORT = 5568
+    ID = b'ASC-E1.17\x00\x00\x00'
+    ROOT_VECTOR = 0x00000004
+    FRAMING_VECTOR = 0x00000002
+    DMP_VECTOR = 0x02
+    OPTION_PREVIEW = 0x80
+    OPTION_TERMINATED = 0x40
+    HEADER_SIZE = 126
+
+    def __init__(self, host='', port=PORT, multicast=True):
+        """
+        Initialize the receiver.
+
+        :param host: The address to listen on. If multicast is enabled,
+                     the address of the interface to join the multicast
+                     groups on.
+        :param port: The UDP port to listen on.
+        :param multicast: Join the multicast groups of mapped universes.
+        """
+        super().__init__(host, port)
+        self._multicast = multicast
+
+    def _get_bind_address(self):
+        """
+        Get the address the socket is bound to.
+
+        :return: The address to bind to.
+        """
+        # Sockets bound to a unicast address do not receive multicast
+        # datagrams, so the host is only used as interface for the groups.
+        if self._multicast:
+            return ''
+        return self._host
+
+    def _setup_socket(self, sock):
+        """
+        Join the multicast groups of all mapped universes.
+
+        :param sock: The bound socket.
+        """
+        if not self._multicast:
+            return
+
+        interface = socket.inet_aton(self._host or '0.0.0.0')
+        for universe in self.universes:
+            group = socket.inet_aton(
+                f'239.255.{universe >> 8 & 0xff}.{universe & 0xff}'
+            )
+            sock.setsockopt(
+                socket.IPPROTO_IP,
+                socket.IP_ADD_MEMBERSHIP,
+                group + interface,
+            )
+
+    def _parse(self, packet):
+        """
+        Decode a sACN data packet.
+
+        :param packet: Memoryview of the received packet.
+        :return: Tuple of universe, sequence number and memoryview of the
+                 channel data, or None, if the packet does not contain
+                 live DMX data.
+        """
+        if len(packet) < self.HEADER_SIZE or packet[4:16] != self.ID:
+            return None
+        if int.from_bytes(packet[18:22], 'big') != self.ROOT_VECTOR:
+            return None
+        if int.from_bytes(packet[40:44], 'big') != self.FRAMING_VECTOR:
+            return None
+        if packet[117] != self.DMP_VECTOR:
+            return None
+        if packet[112] & (self.OPTION_PREVIEW | self.OPTION_TERMINATED):
+            return None
+        # Only the null start code carries dimmer levels
+        if packet[125] != 0:
+            return None
+
+        sequence = packet[111]
+        universe = packet[113] << 8 | packet[114]
+        count = packet[123] << 8 | packet[124]
+        data = packet[self.HEADER_SIZE:self.HEADER_SIZE + count - 1]
+
+        return universe, sequence, data
@@ -40,12 +40,21 @@ class Transition:
         """
         Progress property.
 
+        :return: The progress of the transition (0.0-1.0).
+        """
+        return self._progress_at(time.perf_counter())
+
+    def _progress_at(self, now):
+        """
+        Calculate the progress of the transition at a specific time.
+
+        :param now: The point in time (as returned by time.perf_counter()).
         :return: The progress of the transition (0.0-1.0).
         """
         if self._duration == 0:
             return 1
 
-        run_time = time.perf_counter() - self._start_time
+        run_time = now - self._start_time
         return max(0, min(1, run_time / self._duration))
 
     @property
@@ -66,12 +75,20 @@ class Transition:
         """
         return self._cancelled
 
-    def step(self):
-        """Apply the current stage of the transition based on current time."""
+    def step(self, now=None):
+        """
+        Apply the stage of the transition at the given time.
+
+        :param now: The point in time (as returned by time.perf_counter())
+                    to apply. If omitted, the current time is used.
+        """
         if self.cancelled or self.finished:
             return
 
-        if self.progress == 1:
+        if now is None:
+            now = time.perf_counter()
+        progress = self._progress_at(now)
+        if progress == 1:
             self._finish()
             return
 
@@ -93,6 +110,7 @@ class Transition:
             state['brightness'] = self._interpolate(
                 src_brightness,
                 dest_brightness,
+                progress,
             )
 
         src_color = self._src_state.get('color')
@@ -101,22 +119,24 @@ class Transition:
             src_color = dest_color
         if src_color is not None and dest_color is not None:
             state['color'] = Color(*(
-                self._interpolate(src_color[i], dest_color[i])
+                self._interpolate(src_color[i], dest_color[i], progress)
                 for i in range(3)
             ))
 
         self._led.set(**state, cancel_transition=False)
 
-    def _interpolate(self, start, end):
+    @staticmethod
+    def _interpolate(start, end, progress):
         """
-        Interpolate a value from start to end at the current progress.
+        Interpolate a value from start to end at the given progress.
 
         :param start: The start value.
         :param end: The end value.
-        :return: The interpolated value at the current progress.
+        :param progress: The progress of the transition (0.0-1.0).
+        :return: The interpolated value at the given progress.
         """
         diff = end - start
-        return start + self.progress * diff
+        return start + progress * diff
 
     def _finish(self):
         """Complete transition and mark it as finished."""
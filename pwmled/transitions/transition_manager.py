@@ -13,6 +13,7 @@ class TransitionManager(object, metaclass=Singleton):
         """Initialize the manager."""
         self._thread = None
         self._transitions = []
+        self._overruns = 0
 
     def execute(self, transition):
         """
@@ -31,12 +32,37 @@ class TransitionManager(object, metaclass=Singleton):
 
         return transition
 
+    @property
+    def overruns(self):
+        """
+        Overruns property.
+
+        :return: The number of steps that missed their deadline.
+        """
+        return self._overruns
+
     def _transition_loop(self):
         """Execute all queued transitions step by step."""
+        deadline = time.perf_counter()
         while self._transitions:
-            for transition in self._transitions:
-                transition.step()
+            # Sample the clock once per step, so that all transitions
+            # (e.g. multiple leds fading together) stay in phase.
+            now = time.perf_counter()
+            for transition in list(self._transitions):
+                transition.step(now)
                 if transition.finished:
                     self._transitions.remove(transition)
 
-            time.sleep(self.STEP_TIME)
+            # Schedule against absolute deadlines, so that the time spent
+            # stepping the transitions does not add up to a drift.
+            deadline += self.STEP_TIME
+            delay = deadline - time.perf_counter()
+            if delay <= 0:
+                # Deadline was missed: skip to the next step boundary
+                # instead of executing the missed steps in a burst, but
+                # still yield, so that slow steps do not spin the cpu.
+                self._overruns += 1
+                missed = int(-delay // self.STEP_TIME) + 1
+                deadline += missed * self.STEP_TIME
+                delay = deadline - time.perf_counter()
+            time.sleep(max(0, delay))
@@ -0,0 +1,20 @@
+"""Stubs shared by the tests."""
+from pwmled.driver import Driver
+
+
+class StubDriver(Driver):
+    """Driver recording the raw values written to it."""
+
+    def __init__(self, pins):
+        super().__init__(pins, 8, 200)
+        self.writes = []
+        self.error = None
+
+    def _set_pwm(self, raw_values):
+        if self.error is not None:
+            raise self.error
+        self.writes.append(raw_values)
+
+    @property
+    def output(self):
+        return [v / 255 for v in self.writes[-1]]
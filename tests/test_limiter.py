@@ -0,0 +1,95 @@
+"""Tests for the power limiter."""
+import pytest
+
+from pwmled.limiter import PowerLimiter
+from stubs import StubDriver
+
+
+def test_limits_total_load():
+    limiter = PowerLimiter(2, hysteresis=0)
+    first = StubDriver([1, 2])
+    second = StubDriver([3])
+    limiter.add_driver(first)
+    limiter.add_driver(second, loads=2)
+
+    first.set_pwm([1, 1])
+    assert limiter.factor == 1
+    assert first.output == [1, 1]
+
+    second.set_pwm([1])
+    assert limiter.load == 4
+    assert limiter.factor == 0.5
+    assert first.state == [1, 1]
+    assert first.output == pytest.approx([0.5, 0.5], abs=1 / 255)
+    assert second.output == pytest.approx([0.5], abs=1 / 255)
+
+    second.set_pwm([0])
+    assert limiter.factor == 1
+    assert first.output == [1, 1]
+
+
+def test_fading_drivers_are_not_rewritten_on_every_change():
+    limiter = PowerLimiter(1)
+    drivers = [StubDriver([1]) for _ in range(20)]
+    for driver in drivers:
+        limiter.add_driver(driver)
+
+    for step in range(1, 11):
+        for driver in drivers:
+            driver.set_pwm([step / 10])
+
+    writes = sum(len(driver.writes) for driver in drivers)
+    assert writes < 1000
+    output = sum(driver.output[0] for driver in drivers)
+    assert output <= limiter.budget + len(drivers) / 255
+
+
+def test_failed_write_keeps_load_consistent():
+    limiter = PowerLimiter(1)
+    driver = StubDriver([1])
+    limiter.add_driver(driver)
+
+    driver.error = IOError('Bus error')
+    with pytest.raises(IOError):
+        driver.set_pwm([1])
+    driver.error = None
+    driver.set_pwm([1])
+    driver.set_pwm([0])
+
+    assert limiter.load == 0
+    assert limiter.factor == 1
+
+
+def test_driver_can_only_be_attached_once():
+    limiter = PowerLimiter(1)
+    driver = StubDriver([1])
+    limiter.add_driver(driver)
+
+    with pytest.raises(ValueError):
+        limiter.add_driver(driver)
+    with pytest.raises(ValueError):
+        PowerLimiter(1).add_driver(driver)
+
+    limiter.remove_driver(driver)
+    assert driver.limiter is None
+    assert limiter.load == 0
+
+
+def test_failing_driver_does_not_prevent_rewriting_others():
+    limiter = PowerLimiter(1)
+    first, failing, last = (StubDriver([1]) for _ in range(3))
+    first.set_pwm([0.5])
+    last.set_pwm([0.5])
+    for driver in (first, failing, last):
+        limiter.add_driver(driver)
+
+    failing.error = IOError('Bus error')
+    with pytest.raises(IOError):
+        first.set_pwm([1])
+    assert first.state == [1]
+    assert limiter.load == 1.5
+    assert last.output == pytest.approx([0.5 * limiter.factor], abs=1 / 255)
+
+    failing.error = None
+    first.set_pwm([0.5])
+    assert limiter.load == 1
@@ -0,0 +1,230 @@
+"""Tests for the network frame receivers."""
+import socket
+import time
+
+import pytest
+
+from pwmled.receiver.artnet import ArtNetReceiver
+from pwmled.receiver.sacn import SacnReceiver
+from stubs import StubDriver
+
+HOST = '127.0.0.1'
+
+
+def free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def artnet_packet(universe, data, sequence=0):
+    return (
+        b'Art-Net\x00'
+        + (0x5000).to_bytes(2, 'little')
+        + bytes([0, 14, sequence, 0])
+        + bytes([universe & 0xff, universe >> 8])
+        + len(data).to_bytes(2, 'big')
+        + bytes(data)
+    )
+
+
+def sacn_packet(universe, data, start_code=0, options=0, sequence=0):
+    packet = bytearray(126 + len(data))
+    packet[0:2] = (0x10).to_bytes(2, 'big')
+    packet[4:16] = b'ASC-E1.17\x00\x00\x00'
+    packet[18:22] = (4).to_bytes(4, 'big')
+    packet[40:44] = (2).to_bytes(4, 'big')
+    packet[111] = sequence
+    packet[112] = options
+    packet[113:115] = universe.to_bytes(2, 'big')
+    packet[117] = 0x02
+    packet[118] = 0xa1
+    packet[121:123] = (1).to_bytes(2, 'big')
+    packet[123:125] = (len(data) + 1).to_bytes(2, 'big')
+    packet[125] = start_code
+    packet[126:] = bytes(data)
+    return bytes(packet)
+
+
+def wait_for(condition, timeout=2):
+    end = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > end:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def sender():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        yield sock
+
+
+@pytest.mark.parametrize('receiver_factory, packet_factory', [
+    (lambda port: ArtNetReceiver(HOST, port), artnet_packet),
+    (lambda port: SacnReceiver(HOST, port, multicast=False), sacn_packet),
+])
+def test_loopback(sender, receiver_factory, packet_factory):
+    port = free_port()
+    receiver = receiver_factory(port)
+    rgb = StubDriver([1, 2, 3])
+    single = StubDriver([4])
+    other = StubDriver([5])
+    receiver.add_driver(rgb, universe=258, channel=1)
+    receiver.add_driver(single, universe=258, channel=4)
+    receiver.add_driver(other, universe=1, channel=1)
+
+    receiver.start()
+    try:
+        data = [255, 128, 0, 64] + [0] * 508
+        sender.sendto(packet_factory(258, data), (HOST, port))
+        assert wait_for(lambda: rgb.writes and single.writes)
+    finally:
+        receiver.stop()
+
+    assert rgb.writes == [[255, 128, 0]]
+    assert rgb.state == [1, 128 / 255, 0]
+    assert single.writes == [[64]]
+    assert other.writes == []
+
+
+@pytest.mark.parametrize('packet', [
+    artnet_packet(1, [255]),
+    sacn_packet(1, [255], start_code=0xdd),
+    sacn_packet(1, [255], options=0x80),
+    sacn_packet(1, [255], options=0x40),
+    b'Art-Net\x00',
+    b'',
+])
+def test_sacn_ignores_invalid_packets(packet):
+    receiver = SacnReceiver(multicast=False)
+    assert receiver._parse(memoryview(packet)) is None
+
+
+@pytest.mark.parametrize('packet', [
+    artnet_packet(1, [255])[:8] + (0x2000).to_bytes(2, 'little')
+    + artnet_packet(1, [255])[10:],
+    sacn_packet(1, [255]),
+    b'Art-Net\x00',
+])
+def test_artnet_ignores_invalid_packets(packet):
+    receiver = ArtNetReceiver()
+    assert receiver._parse(memoryview(packet)) is None
+
+
+def test_skips_unchanged_frames():
+    receiver = ArtNetReceiver()
+    driver = StubDriver([1])
+    receiver.add_driver(driver, universe=0, channel=2)
+
+    receiver._apply_frame(0, memoryview(bytes([0, 255])))
+    receiver._apply_frame(0, memoryview(bytes([0, 255])))
+    assert driver.writes == [[255]]
+
+    # Frame is reapplied if the driver was written by others meanwhile
+    driver.set_pwm([0])
+    receiver._apply_frame(0, memoryview(bytes([0, 255])))
+    assert driver.writes == [[255], [0], [255]]
+
+
+def test_skips_short_frames():
+    receiver = ArtNetReceiver()
+    driver = StubDriver([1, 2])
+    receiver.add_driver(driver, universe=0, channel=3)
+
+    receiver._apply_frame(0, memoryview(bytes([0, 0, 255])))
+    assert driver.writes == []
+
+
+def test_channel_out_of_range():
+    receiver = ArtNetReceiver()
+    with pytest.raises(ValueError):
+        receiver.add_driver(StubDriver([1, 2]), universe=0, channel=512)
+
+
+def test_restart_after_error():
+    receiver = ArtNetReceiver(HOST, free_port())
+    receiver.start()
+    # Closing the socket makes receiving fail
+    receiver._socket.close()
+    assert wait_for(lambda: not receiver.running)
+    assert isinstance(receiver.error, OSError)
+
+    receiver.start()
+    try:
+        assert receiver.running
+        assert receiver.error is None
+    finally:
+        receiver.stop()
+
+
+def test_failing_driver_does_not_affect_others():
+    receiver = ArtNetReceiver()
+    failing = StubDriver([1])
+    # Not an IOError, like errors of the pigpio library
+    failing.error = RuntimeError('Bus error')
+    driver = StubDriver([2])
+    receiver.add_driver(failing, universe=0, channel=1)
+    receiver.add_driver(driver, universe=0, channel=2)
+
+    receiver._apply_frame(0, memoryview(bytes([255, 255])))
+    assert driver.writes == [[255]]
+
+
+def test_stores_unexpected_errors():
+    class BrokenReceiver(ArtNetReceiver):
+        def _parse(self, packet):
+            raise RuntimeError('Broken')
+
+    port = free_port()
+    receiver = BrokenReceiver(HOST, port)
+    receiver.start()
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+            sender.sendto(b'packet', (HOST, port))
+        assert wait_for(lambda: not receiver.running)
+        assert isinstance(receiver.error, RuntimeError)
+    finally:
+        receiver.stop()
+
+
+@pytest.mark.parametrize('receiver, packet_factory', [
+    (ArtNetReceiver(), artnet_packet),
+    (SacnReceiver(), sacn_packet),
+])
+def test_parses_sequence(receiver, packet_factory):
+    universe, sequence, data = receiver._parse(
+        memoryview(packet_factory(3, [1, 2], sequence=42))
+    )
+    assert universe == 3
+    assert sequence == 42
+    assert bytes(data) == bytes([1, 2])
+
+
+def test_artnet_sequence_zero_disables_sequencing():
+    receiver = ArtNetReceiver()
+    _, sequence, _ = receiver._parse(memoryview(artnet_packet(3, [1])))
+    assert sequence is None
+
+
+def test_discards_out_of_sequence_packets():
+    receiver = SacnReceiver()
+    assert receiver._is_in_sequence(1, 10)
+    assert receiver._is_in_sequence(1, 11)
+    # Reordered and duplicated packets
+    assert not receiver._is_in_sequence(1, 9)
+    assert not receiver._is_in_sequence(1, 11)
+    # Sequences are tracked per universe
+    assert receiver._is_in_sequence(2, 5)
+    # Wrap around
+    assert receiver._is_in_sequence(1, 100)
+    assert receiver._is_in_sequence(1, 200)
+    assert receiver._is_in_sequence(1, 255)
+    assert receiver._is_in_sequence(1, 0)
+    assert not receiver._is_in_sequence(1, 250)
+    # Large jumps, e.g. after a restart of the sender
+    assert receiver._is_in_sequence(1, 200)
+    # Disabled sequencing
+    assert receiver._is_in_sequence(1, None)
+    assert receiver._is_in_sequence(1, None)
@@ -0,0 +1,115 @@
+"""Tests for the transitions and their execution."""
+import time
+
+import pytest
+
+from pwmled.led import SimpleLed
+from pwmled.transitions.transition import Transition
+from pwmled.transitions.transition_manager import TransitionManager
+from stubs import StubDriver
+
+STEP_TIME = TransitionManager.STEP_TIME
+
+
+class FakeClock:
+    """Clock that only advances when sleeping or explicitly told so."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, duration):
+        self.sleeps.append(duration)
+        self.now += duration
+
+
+class RecordingTransition(Transition):
+    """Transition recording the times it was stepped at."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.step_times = []
+
+    def step(self, now=None):
+        self.step_times.append(now)
+        super().step(now)
+
+
+class SlowTransition:
+    """Transition whose steps take longer than the step time."""
+
+    def __init__(self, clock, step_duration, steps):
+        self._clock = clock
+        self._step_duration = step_duration
+        self._steps = steps
+        self.step_times = []
+
+    @property
+    def finished(self):
+        return len(self.step_times) == self._steps
+
+    def step(self, now):
+        self.step_times.append(now)
+        self._clock.now += self._step_duration
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, 'perf_counter', clock.perf_counter)
+    monkeypatch.setattr(time, 'sleep', clock.sleep)
+    return clock
+
+
+def create_transition(duration, **dest_state):
+    led = SimpleLed(StubDriver([1]))
+    led.on()
+    return led, RecordingTransition(led, duration, led.state, dest_state)
+
+
+def run_loop(*transitions):
+    manager = TransitionManager()
+    manager._transitions = list(transitions)
+    manager._transition_loop()
+    return manager
+
+
+def test_transitions_stepped_together_are_in_phase(clock):
+    first_led, first = create_transition(1, brightness=0)
+    second_led, second = create_transition(1, brightness=0.5)
+
+    first.step(0.5)
+    second.step(0.5)
+
+    assert first_led.brightness == 0.5
+    assert second_led.brightness == 0.75
+
+
+def test_transition_finishes_on_first_step_after_deadline(clock):
+    led, transition = create_transition(2.5 * STEP_TIME, brightness=0)
+
+    run_loop(transition)
+
+    assert transition.finished
+    assert led.brightness == 0
+    assert transition.step_times == pytest.approx([0, STEP_TIME,
+                                                   2 * STEP_TIME,
+                                                   3 * STEP_TIME])
+
+
+def test_overrun_skips_to_next_step_boundary(clock):
+    transition = SlowTransition(clock, 2.5 * STEP_TIME, steps=3)
+    overruns = TransitionManager().overruns
+
+    manager = run_loop(transition)
+
+    assert manager.overruns - overruns == 3
+    # Missed steps are skipped instead of being executed in a burst
+    assert transition.step_times == pytest.approx([0, 3 * STEP_TIME,
+                                                   6 * STEP_TIME])
+    # The loop still yields on overruns
+    assert len(clock.sleeps) == 3
+    assert all(duration > 0 for duration in clock.sleeps)